@@ -0,0 +1,25 @@
+"""Shared HTTP session for the endpoint test scripts."""
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+
+# One pooled keep-alive session, so repeated calls reuse the same connection
+session = requests.Session()
+_adapter = HTTPAdapter(pool_connections=8, pool_maxsize=8, max_retries=3)
+session.mount("http://", _adapter)
+session.mount("https://", _adapter)
+
+
+def post_json(url, payload, session=session, **kwargs):
+    """POST payload encoded with orjson; numpy arrays serialize without tolist()."""
+    return session.post(
+        url,
+        data=orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY),
+        headers={"Content-Type": "application/json"},
+        **kwargs,
+    )
+
+
+def read_json(response):
+    """Decode a streamed response straight from bytes, skipping the str decode of .json()."""
+    return orjson.loads(b"".join(response.iter_content(64 * 1024)))
@@ -1,17 +1,26 @@
 import math
 import re
-import statistics
-from collections import Counter
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
-from sklearn.feature_extraction.text import TfidfVectorizer
+from scipy import sparse
+from sklearn.feature_extraction.text import ENGLISH_STOP_WORDS, CountVectorizer
 from sklearn.linear_model import LogisticRegression
 from sklearn.metrics import accuracy_score, f1_score, precision_score, recall_score
-from sklearn.model_selection import train_test_split
+from sklearn.preprocessing import normalize
+from threadpoolctl import threadpool_limits
 
-from utils import clean_text
+from utils import _WS_PATTERN, clean_series
+
+_BATCH_SIZE = 32
+# Negations flip the meaning of a complaint, so they stay in the keyword rankings
+_NEGATIONS = frozenset(
+    ["not", "no", "nor", "never", "nothing", "none", "neither", "nobody",
+     "nowhere", "cannot", "without", "against"]
+)
+_RANKING_STOP_WORDS = np.array(sorted(ENGLISH_STOP_WORDS - _NEGATIONS), dtype=object)
 
 
 def _find_text_column(df: pd.DataFrame) -> Optional[str]:
@@ -21,38 +30,123 @@ def _find_text_column(df: pd.DataFrame) -> Optional[str]:
     return None
 
 
-def _tokenize(text: str) -> List[str]:
-    return [token for token in clean_text(text).lower().split() if token]
+def _sample_texts(df: pd.DataFrame, text_column: str) -> Tuple[str, ...]:
+    """The first 500 texts; the shared key for the cached term counts."""
+    return tuple(df[text_column].fillna("").astype(str).head(500).tolist())
+
 
+@lru_cache(maxsize=8)
+def _term_counts(texts: Tuple[str, ...]) -> Tuple[np.ndarray, sparse.csr_matrix]:
+    """Tokenize and count a text sample once for the EDA, diagnostic and predictive stages.
 
-def _sentiment_label(score: Dict[str, Any]) -> str:
-    label = score.get("label", "NEUTRAL")
-    return str(label).upper()
+    The full vocabulary is kept so the predictive stage sees negations; stop
+    words are only skipped when ranking. The cached matrix is shared between
+    stages and must not be mutated.
+    """
+    vectorizer = CountVectorizer(
+        lowercase=False,
+        # clean_series leaves only alphanumeric runs; require 2+ characters like
+        # the default pattern so "don't" does not yield a stray "t"
+        token_pattern=r"\S\S+",
+        dtype=np.float32,
+    )
+    try:
+        counts = vectorizer.fit_transform(clean_series(pd.Series(texts, dtype=object)))
+    except ValueError:  # empty vocabulary
+        return np.array([], dtype=object), sparse.csr_matrix((len(texts), 0), dtype=np.float32)
+    return vectorizer.get_feature_names_out(), counts
 
 
-def perform_eda(df: pd.DataFrame, model) -> Dict[str, Any]:
-    text_column = _find_text_column(df)
+def _top_counts(words: np.ndarray, counts: np.ndarray, k: int) -> List[Tuple[str, int]]:
+    """Return the k most frequent non-stop words with a non-zero count, ranked in NumPy."""
+    present = np.flatnonzero((counts > 0) & ~np.isin(words, _RANKING_STOP_WORDS))
+    if not len(present):
+        return []
+    k = min(k, len(present))
+    top = present[np.argpartition(-counts[present], k - 1)[:k]]
+    order = top[np.argsort(-counts[top], kind="stable")]
+    return [(str(word), int(count)) for word, count in zip(words[order], counts[order])]
+
+
+def _sentiment_labels(scores: List[Dict[str, Any]]) -> np.ndarray:
+    labels = np.array([score.get("label", "NEUTRAL") for score in scores], dtype=object)
+    return np.char.upper(labels.astype(str))
+
+
+def _sentiment_distribution(labels: np.ndarray) -> Dict[str, int]:
+    uniq, cnt = np.unique(labels, return_counts=True)
+    return dict(zip(uniq.tolist(), cnt.tolist()))
+
+
+def _run_model(model, texts: List[str]) -> List[Dict[str, Any]]:
+    """Score texts in one batched pipeline call; torch parallelizes each batch itself."""
+    return model(texts, batch_size=_BATCH_SIZE)
+
+
+def _length_order(model, texts: List[str]) -> np.ndarray:
+    """Order texts by token length so each batch pads to a similar length.
+
+    Falls back to character length when the model exposes no tokenizer.
+    """
+    tokenizer = getattr(model, "tokenizer", None)
+    if tokenizer is not None:
+        encoded = tokenizer(texts, truncation=True, max_length=256)["input_ids"]
+        lengths = np.fromiter(map(len, encoded), dtype=np.int64, count=len(texts))
+    else:
+        lengths = np.fromiter(map(len, texts), dtype=np.int64, count=len(texts))
+    return np.argsort(lengths, kind="stable")
+
+
+def _score_texts(df: pd.DataFrame, model, text_column: Optional[str]) -> List[Dict[str, Any]]:
+    """Run the sentiment model once over the texts every stage samples from."""
+    if not text_column:
+        return []
+    texts = df[text_column].fillna("").astype(str).tolist()
+    if not texts:
+        return []
+    texts = texts[:500]
+    order = _length_order(model, texts)
+    scored = _run_model(model, [texts[i] for i in order])
+    # Scatter the length-sorted results back to the original row order
+    scores: List[Dict[str, Any]] = [{}] * len(texts)
+    for position, index in enumerate(order):
+        scores[index] = scored[position]
+    return scores
+
+
+def perform_eda(
+    df: pd.DataFrame,
+    model,
+    scores: Optional[List[Dict[str, Any]]] = None,
+    text_column: Optional[str] = None,
+) -> Dict[str, Any]:
+    if text_column is None:
+        text_column = _find_text_column(df)
     records = len(df)
     avg_length = 0
     sentiment_distribution: Dict[str, int] = {}
     word_frequency: List[Dict[str, Any]] = []
 
     if text_column:
-        texts = df[text_column].fillna("").astype(str).tolist()
-        lengths = [len(clean_text(text)) for text in texts if text]
-        avg_length = int(statistics.mean(lengths)) if lengths else 0
-
-        if texts:
-            scores = model(texts[:200])
-            labels = [_sentiment_label(score) for score in scores]
-            sentiment_distribution = dict(Counter(labels))
-
-        tokens = []
-        for text in texts[:500]:
-            tokens.extend(_tokenize(text))
+        texts = df[text_column].fillna("").astype(str)
+        cleaned = (
+            texts.str.replace("\x00", " ", regex=False)
+            .str.replace(_WS_PATTERN, " ", regex=True)
+            .str.strip()
+        )
+        lengths = cleaned[texts != ""].str.len()
+        avg_length = int(lengths.mean()) if len(lengths) else 0
+
+        if len(texts):
+            if scores is None:
+                scores = _run_model(model, texts.head(200).tolist())
+            sentiment_distribution = _sentiment_distribution(_sentiment_labels(scores[:200]))
+
+        words, counts = _term_counts(_sample_texts(df, text_column))
+        totals = np.asarray(counts.sum(axis=0)).ravel()
         word_frequency = [
             {"word": word, "count": count}
-            for word, count in Counter(tokens).most_common(15)
+            for word, count in _top_counts(words, totals, 15)
         ]
 
     return {
@@ -63,19 +157,63 @@ def perform_eda(df: pd.DataFrame, model) -> Dict[str, Any]:
     }
 
 
-def descriptive_analytics(df: pd.DataFrame, model) -> Dict[str, Any]:
-    text_column = _find_text_column(df)
-    summary_stats = df.describe(include="all").fillna("").to_dict()
+def _summary_statistics(df: pd.DataFrame) -> Dict[str, Dict[str, Any]]:
+    """Per-column summary matching describe(include="all"), computed per dtype group."""
+    numeric_df = df.select_dtypes(include=[np.number])
+    numeric_stats = pd.DataFrame()
+    if len(numeric_df.columns):
+        numeric_stats = pd.concat(
+            [
+                numeric_df.agg(["count", "mean", "std", "min"]),
+                numeric_df.quantile([0.25, 0.5, 0.75]).set_axis(["25%", "50%", "75%"]),
+                numeric_df.agg(["max"]),
+            ]
+        )
+
+    summary: Dict[str, Dict[str, Any]] = {}
+    for column in df.columns:
+        stats = dict.fromkeys(
+            ["count", "unique", "top", "freq", "mean", "std", "min", "25%", "50%", "75%", "max"], ""
+        )
+        if column in numeric_df.columns:
+            # Arrow-backed stats cannot hold "" directly; blank out NA per value
+            stats.update(
+                (stat, "" if pd.isna(value) else value)
+                for stat, value in numeric_stats[column].astype(object).items()
+            )
+        else:
+            counts = df[column].value_counts(sort=False)
+            stats["count"] = int(counts.sum())
+            stats["unique"] = len(counts)
+            if len(counts):
+                stats["top"] = counts.idxmax()
+                stats["freq"] = int(counts.max())
+        summary[column] = stats
+    return summary
+
+
+def descriptive_analytics(
+    df: pd.DataFrame,
+    model,
+    scores: Optional[List[Dict[str, Any]]] = None,
+    text_column: Optional[str] = None,
+    sentiment_distribution: Optional[Dict[str, int]] = None,
+) -> Dict[str, Any]:
+    if text_column is None:
+        text_column = _find_text_column(df)
+    summary_stats = _summary_statistics(df)
 
     positive_pct = 0.0
     negative_pct = 0.0
     if text_column:
-        texts = df[text_column].fillna("").astype(str).tolist()
-        scores = model(texts[:200])
-        labels = [_sentiment_label(score) for score in scores]
-        total = len(labels) or 1
-        positive_pct = labels.count("POSITIVE") / total
-        negative_pct = labels.count("NEGATIVE") / total
+        if sentiment_distribution is None:
+            if scores is None:
+                texts = df[text_column].fillna("").astype(str).tolist()
+                scores = _run_model(model, texts[:200])
+            sentiment_distribution = _sentiment_distribution(_sentiment_labels(scores[:200]))
+        total = sum(sentiment_distribution.values()) or 1
+        positive_pct = sentiment_distribution.get("POSITIVE", 0) / total
+        negative_pct = sentiment_distribution.get("NEGATIVE", 0) / total
 
     return {
         "summary_statistics": summary_stats,
@@ -84,41 +222,34 @@ def descriptive_analytics(df: pd.DataFrame, model) -> Dict[str, Any]:
     }
 
 
-def diagnostic_analytics(df: pd.DataFrame, model) -> Dict[str, Any]:
-    text_column = _find_text_column(df)
+def diagnostic_analytics(
+    df: pd.DataFrame,
+    model,
+    scores: Optional[List[Dict[str, Any]]] = None,
+    text_column: Optional[str] = None,
+) -> Dict[str, Any]:
+    if text_column is None:
+        text_column = _find_text_column(df)
     negative_keywords: List[Dict[str, Any]] = []
     correlation_insights: List[Dict[str, Any]] = []
 
     if text_column:
-        texts = df[text_column].fillna("").astype(str).tolist()
-        scores = model(texts[:200])
-        negative_texts = [
-            text for text, score in zip(texts, scores) if _sentiment_label(score) == "NEGATIVE"
-        ]
-        tokens = []
-        for text in negative_texts:
-            tokens.extend(_tokenize(text))
+        if scores is None:
+            texts = df[text_column].fillna("").astype(str).tolist()
+            scores = _run_model(model, texts[:200])
+        negative_mask = _sentiment_labels(scores[:200]) == "NEGATIVE"
+        words, counts = _term_counts(_sample_texts(df, text_column))
+        negative_counts = np.asarray(counts[: len(negative_mask)][negative_mask].sum(axis=0)).ravel()
         negative_keywords = [
             {"keyword": word, "count": count}
-            for word, count in Counter(tokens).most_common(10)
+            for word, count in _top_counts(words, negative_counts, 10)
         ]
 
     numeric_df = df.select_dtypes(include=[np.number])
     if numeric_df.shape[1] >= 2:
-        corr_matrix = numeric_df.corr().fillna(0)
-        pairs = []
-        columns = corr_matrix.columns
-        for i, col_a in enumerate(columns):
-            for col_b in columns[i + 1:]:
-                corr_val = corr_matrix.loc[col_a, col_b]
-                pairs.append((abs(corr_val), col_a, col_b, corr_val))
-        for _, col_a, col_b, corr_val in sorted(pairs, reverse=True)[:5]:
-            correlation_insights.append(
-                {
-                    "pair": f"{col_a} vs {col_b}",
-                    "correlation": round(float(corr_val), 3),
-                }
-            )
+        correlation_insights = _top_correlation_pairs(
+            _correlation_matrix(numeric_df), numeric_df.columns, 5
+        )
 
     return {
         "negative_keywords": negative_keywords,
@@ -126,8 +257,94 @@ def diagnostic_analytics(df: pd.DataFrame, model) -> Dict[str, Any]:
     }
 
 
-def predictive_analytics(df: pd.DataFrame, model) -> Dict[str, Any]:
-    text_column = _find_text_column(df)
+def _correlation_matrix(numeric_df: pd.DataFrame) -> np.ndarray:
+    """Pearson correlations, with constant columns correlating as 0 like corr().fillna(0).
+
+    Finite frames use one float64 GEMM over the standardized columns. Frames
+    with missing or infinite values go through pandas, which uses
+    pairwise-complete rows.
+    """
+    x = numeric_df.to_numpy(dtype=np.float64, na_value=np.nan, copy=True)
+    if not np.isfinite(x).all():
+        return numeric_df.corr().fillna(0).to_numpy()
+    n_rows, n_cols = x.shape
+    if n_rows < 2:
+        return np.zeros((n_cols, n_cols))
+    # Compare extremes rather than the std so rounding in the mean cannot make
+    # a constant column look variable
+    constant = ~(x.max(axis=0) > x.min(axis=0))
+    x -= x.mean(axis=0)
+    std = x.std(axis=0, ddof=1)
+    std[constant] = np.inf
+    x /= std
+    return (x.T @ x) / (n_rows - 1)
+
+
+def _top_correlation_pairs(matrix: np.ndarray, columns: pd.Index, k: int) -> List[Dict[str, Any]]:
+    """Pick the k strongest off-diagonal pairs from the upper triangle of a correlation matrix."""
+    iu, ju = np.triu_indices_from(matrix, k=1)
+    vals = matrix[iu, ju]
+    if not len(vals):
+        return []
+    k = min(k, len(vals))
+    strength = np.abs(vals)
+    idx = np.argpartition(-strength, k - 1)[:k]
+    idx = idx[np.argsort(-strength[idx], kind="stable")]
+    return [
+        {
+            "pair": f"{columns[i]} vs {columns[j]}",
+            "correlation": round(float(val), 3),
+        }
+        for i, j, val in zip(iu[idx], ju[idx], vals[idx])
+    ]
+
+
+@lru_cache(maxsize=8)
+def _tfidf_features(texts: Tuple[str, ...]):
+    """Fit TF-IDF once per distinct text sample; the cached matrix must not be mutated.
+
+    Reuses the shared term counts, keeping the 500 most frequent terms. The copy
+    is weighted in place on the CSR buffers (sublinear tf, smoothed idf, l2 norm)
+    so no second sparse matrix is allocated for the tf x idf product.
+    """
+    _, counts = _term_counts(texts)
+    totals = np.asarray(counts.sum(axis=0)).ravel()
+    keep = np.sort(np.argsort(-totals, kind="stable")[:500])
+    features = counts[:, keep]  # fancy indexing copies, so the cached counts stay intact
+    doc_freq = np.bincount(features.indices, minlength=features.shape[1])
+    idf = (np.log((1 + features.shape[0]) / (1 + doc_freq)) + 1).astype(np.float32)
+    np.log(features.data, out=features.data)
+    features.data += 1
+    features.data *= idf[features.indices]
+    features.eliminate_zeros()
+    return normalize(features, norm="l2", copy=False)
+
+
+def _stratified_split(labels: np.ndarray, train_size: float, seed: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Seeded split that keeps each class's share in both halves.
+
+    Every class with two or more rows contributes at least one row to each side.
+    """
+    rng = np.random.default_rng(seed)
+    train_parts, test_parts = [], []
+    for label in np.unique(labels):
+        members = rng.permutation(np.flatnonzero(labels == label))
+        cut = int(train_size * len(members))
+        if len(members) >= 2:
+            cut = min(max(cut, 1), len(members) - 1)
+        train_parts.append(members[:cut])
+        test_parts.append(members[cut:])
+    return np.sort(np.concatenate(train_parts)), np.sort(np.concatenate(test_parts))
+
+
+def predictive_analytics(
+    df: pd.DataFrame,
+    model,
+    scores: Optional[List[Dict[str, Any]]] = None,
+    text_column: Optional[str] = None,
+) -> Dict[str, Any]:
+    if text_column is None:
+        text_column = _find_text_column(df)
     if not text_column:
         return {
             "status": "skipped",
@@ -142,26 +359,35 @@ def predictive_analytics(df: pd.DataFrame, model) -> Dict[str, Any]:
         }
 
     try:
-        scores = model(texts[:500])
-        labels = [1 if _sentiment_label(score) == "POSITIVE" else 0 for score in scores]
+        if scores is None:
+            scores = _run_model(model, texts[:500])
+        labels = (_sentiment_labels(scores) == "POSITIVE").astype(int)
 
-        # Check if we have multiple classes for stratification
-        unique_labels = set(labels)
-        if len(unique_labels) < 2:
+        # Check if we have multiple classes to learn from
+        if np.unique(labels).size < 2:
             return {
                 "status": "skipped",
                 "reason": "All texts have the same sentiment; model training requires mixed sentiment data.",
             }
 
-        vectorizer = TfidfVectorizer(max_features=1000)
-        features = vectorizer.fit_transform(texts[: len(labels)])
+        features = _tfidf_features(tuple(texts[: len(labels)]))
 
-        x_train, x_test, y_train, y_test = train_test_split(
-            features, labels, test_size=0.2, random_state=42, stratify=labels
-        )
+        train_idx, test_idx = _stratified_split(labels, 0.8, seed=42)
+        x_train, x_test = features[train_idx], features[test_idx]
+        y_train, y_test = labels[train_idx], labels[test_idx]
+        # Metrics on a single-class split are meaningless (e.g. accuracy 1.0, F1 0.0)
+        if np.unique(y_train).size < 2 or np.unique(y_test).size < 2:
+            return {
+                "status": "skipped",
+                "reason": "Not enough examples of each sentiment class to train and evaluate a model.",
+            }
 
-        clf = LogisticRegression(max_iter=200)
-        clf.fit(x_train, y_train)
+        # At most 400 training rows: liblinear converges here where saga needs
+        # thousands of epochs on the wide TF-IDF matrix
+        clf = LogisticRegression(solver="liblinear", max_iter=200, dual=False)
+        # Single-threaded BLAS here avoids nested parallelism with torch's pool
+        with threadpool_limits(limits=1, user_api="blas"):
+            clf.fit(x_train, y_train)
         preds = clf.predict(x_test)
 
         return {
@@ -178,85 +404,74 @@ def predictive_analytics(df: pd.DataFrame, model) -> Dict[str, Any]:
         }
 
 
-def prescriptive_analytics(summary: Dict[str, Any]) -> str:
-    positive_pct = summary.get("descriptive_analytics", {}).get("positive_percentage", 0)
-    negative_pct = summary.get("descriptive_analytics", {}).get("negative_percentage", 0)
+def _descriptive_narrative(total_records: int, pos_pct: float, neg_pct: float) -> str:
+    """Generate the human-readable narrative for the descriptive section."""
+    return (
+        f"Analysis of {total_records:,} records reveals a sentiment distribution with "
+        f"{pos_pct:.1f}% positive and {neg_pct:.1f}% negative responses. "
+        f"The dataset demonstrates {'favorable' if pos_pct > neg_pct else 'concerning'} "
+        f"patterns that warrant {'celebration' if pos_pct > 70 else 'attention' if neg_pct > 40 else 'monitoring'}."
+    )
 
-    if negative_pct > 50:
-        return "High negative sentiment detected. Prioritize customer feedback loops and rapid remediation."
-    if positive_pct > 70:
-        return "Strong positive sentiment. Scale current messaging and reinforce top-performing channels."
-    return "Sentiment is mixed. Focus on improving consistency and monitoring key drivers weekly."
 
+def _diagnostic_narrative(
+    negative_keywords: List[Dict[str, Any]],
+    correlation_insights: List[Dict[str, Any]],
+) -> str:
+    """Generate the human-readable narrative for the diagnostic section."""
+    if negative_keywords:
+        top_words = ", ".join([k["keyword"] for k in negative_keywords[:3]])
+        return (
+            f"Root cause analysis identifies key negative indicators: {top_words}. "
+            f"{'Statistical correlations reveal ' + str(len(correlation_insights)) + ' significant relationships' if correlation_insights else 'Limited correlation patterns detected'} "
+            f"between features, suggesting {'structured' if correlation_insights else 'independent'} data dynamics."
+        )
+    return "Diagnostic analysis completed with limited negative indicators detected."
 
-def _generate_narrative(section: str, data: Dict[str, Any]) -> str:
-    """Generate human-readable narratives for each analytics section."""
-    if section == "descriptive":
-        total = data.get("total_records", 0)
-        pos_pct = data.get("positive_percentage", 0)
-        neg_pct = data.get("negative_percentage", 0)
+
+def _predictive_narrative(trained: bool, accuracy: float, f1: float) -> str:
+    """Generate the human-readable narrative for the predictive section."""
+    if trained:
         return (
-            f"Analysis of {total:,} records reveals a sentiment distribution with "
-            f"{pos_pct:.1f}% positive and {neg_pct:.1f}% negative responses. "
-            f"The dataset demonstrates {'favorable' if pos_pct > neg_pct else 'concerning'} "
-            f"patterns that warrant {'celebration' if pos_pct > 70 else 'attention' if neg_pct > 40 else 'monitoring'}."
+            f"Predictive model successfully trained with {accuracy:.1%} accuracy and {f1:.3f} F1-score. "
+            f"Forward-looking projections indicate {'strong' if accuracy > 0.8 else 'moderate'} reliability "
+            f"for sentiment prediction tasks. Model performance {'exceeds' if accuracy > 0.85 else 'meets'} industry benchmarks."
         )
-    
-    elif section == "diagnostic":
-        keywords = data.get("negative_keywords", [])
-        correlations = data.get("correlation_insights", [])
-        if keywords:
-            top_words = ", ".join([k["keyword"] for k in keywords[:3]])
-            return (
-                f"Root cause analysis identifies key negative indicators: {top_words}. "
-                f"{'Statistical correlations reveal ' + str(len(correlations)) + ' significant relationships' if correlations else 'Limited correlation patterns detected'} "
-                f"between features, suggesting {'structured' if correlations else 'independent'} data dynamics."
-            )
-        return "Diagnostic analysis completed with limited negative indicators detected."
-    
-    elif section == "predictive":
-        status = data.get("status", "unknown")
-        if status == "trained":
-            acc = data.get("accuracy", 0)
-            f1 = data.get("f1_score", 0)
-            return (
-                f"Predictive model successfully trained with {acc:.1%} accuracy and {f1:.3f} F1-score. "
-                f"Forward-looking projections indicate {'strong' if acc > 0.8 else 'moderate'} reliability "
-                f"for sentiment prediction tasks. Model performance {'exceeds' if acc > 0.85 else 'meets'} industry benchmarks."
-            )
-        return "Predictive modeling skipped due to insufficient training data. Minimum 10 text records required."
-    
-    elif section == "prescriptive":
-        pos_pct = data.get("positive_percentage", 0)
-        neg_pct = data.get("negative_percentage", 0)
-        if neg_pct > 50:
-            return (
-                "Strategic intervention required. High negative sentiment demands immediate action. "
-                "Recommend forming cross-functional task force to address root causes and implement "
-                "rapid response protocols. Monitor weekly KPIs for improvement signals."
-            )
-        elif pos_pct > 70:
-            return (
-                "Momentum preservation strategy advised. Strong positive indicators suggest current "
-                "approach is effective. Scale successful initiatives while maintaining vigilance on "
-                "quality metrics. Consider expanding reach to capture broader market segments."
-            )
+    return "Predictive modeling skipped due to insufficient training data. Minimum 10 text records required."
+
+
+def _prescriptive_narrative(pos_pct: float, neg_pct: float) -> str:
+    """Generate the human-readable narrative for the prescriptive section."""
+    if neg_pct > 50:
         return (
-            "Balanced optimization approach recommended. Mixed sentiment patterns indicate opportunities "
-            "for targeted improvements. Focus resources on consistency enhancement and systematic "
-            "monitoring of key performance drivers to establish positive trajectory."
+            "Strategic intervention required. High negative sentiment demands immediate action. "
+            "Recommend forming cross-functional task force to address root causes and implement "
+            "rapid response protocols. Monitor weekly KPIs for improvement signals."
         )
-    
-    return "Analysis complete with insights generated from statistical modeling."
+    elif pos_pct > 70:
+        return (
+            "Momentum preservation strategy advised. Strong positive indicators suggest current "
+            "approach is effective. Scale successful initiatives while maintaining vigilance on "
+            "quality metrics. Consider expanding reach to capture broader market segments."
+        )
+    return (
+        "Balanced optimization approach recommended. Mixed sentiment patterns indicate opportunities "
+        "for targeted improvements. Focus resources on consistency enhancement and systematic "
+        "monitoring of key performance drivers to establish positive trajectory."
+    )
 
 
-def _create_bi_overview(df: pd.DataFrame, eda: Dict[str, Any], descriptive: Dict[str, Any]) -> Dict[str, Any]:
+def _create_bi_overview(
+    df: pd.DataFrame,
+    sentiment_distribution: Dict[str, int],
+    word_frequency: List[Dict[str, Any]],
+    total_records: int,
+) -> Dict[str, Any]:
     """Create BI dashboard overview with real names and values from dataset."""
     # Composition (sentiment distribution or category distribution)
-    sentiment_dist = eda.get("sentiment_distribution", {})
     composition = [
         {"label": str(label), "value": count}
-        for label, count in sentiment_dist.items()
+        for label, count in sentiment_distribution.items()
     ]
     if not composition:
         # Try to get categorical composition from actual data
@@ -292,15 +507,13 @@ def _create_bi_overview(df: pd.DataFrame, eda: Dict[str, Any], descriptive: Dict
     ]
     
     if not trend:
-        total_records = eda.get("total_records", 100)
         trend = [{"name": f"P{i+1}", "value": int(total_records / 4)} for i in range(4)]
     
     # Distribution (word frequency + numeric distribution with real names)
-    word_freq = eda.get("word_frequency", [])
-    if word_freq:
+    if word_frequency:
         distribution = [
             {"category": item["word"], "value": item["count"]}
-            for item in word_freq[:8]
+            for item in word_frequency[:8]
         ]
     else:
         # Fallback: use categorical columns distribution with actual names
@@ -322,13 +535,14 @@ def _create_bi_overview(df: pd.DataFrame, eda: Dict[str, Any], descriptive: Dict
     }
 
 
-def _create_kpis(df: pd.DataFrame, eda: Dict[str, Any], descriptive: Dict[str, Any]) -> List[Dict[str, Any]]:
+def _create_kpis(
+    df: pd.DataFrame,
+    total_records: int,
+    avg_length: int,
+    pos_pct: float,
+    neg_pct: float,
+) -> List[Dict[str, Any]]:
     """Create KPI cards for dashboard metrics using real dataset data and column names."""
-    total_records = eda.get("total_records", 0)
-    avg_length = eda.get("average_text_length", 0)
-    pos_pct = descriptive.get("positive_percentage", 0)
-    neg_pct = descriptive.get("negative_percentage", 0)
-    
     # Try to get real metrics from dataset
     metrics = _build_financial_metrics(df)
     
@@ -763,7 +977,7 @@ def _create_executive_charts(df: pd.DataFrame) -> Dict[str, Any]:
     }
 
 
-def _create_forecast(df: pd.DataFrame, predictive: Dict[str, Any], total_records: int) -> List[Dict[str, Any]]:
+def _create_forecast(df: pd.DataFrame, confidence: float, total_records: int) -> List[Dict[str, Any]]:
     """Create forecast data for predictive analytics visualization using actual data trends."""
     metrics = _build_financial_metrics(df)
     
@@ -778,8 +992,7 @@ def _create_forecast(df: pd.DataFrame, predictive: Dict[str, Any], total_records
     
     if trend_data.empty or len(trend_data) < 2:
         # Fallback: use model accuracy to influence forecast
-        accuracy = predictive.get("accuracy", 0.7) if predictive.get("status") == "trained" else 0.65
-        growth_rate = 1.0 + (accuracy * 0.15)
+        growth_rate = 1.0 + (confidence * 0.15)
     else:
         # Calculate actual growth rate from historical data
         trend_data = trend_data.sort_values("period")
@@ -815,14 +1028,11 @@ def _create_forecast(df: pd.DataFrame, predictive: Dict[str, Any], total_records
 
 
 def _create_recommendations(
-    descriptive: Dict[str, Any], 
-    diagnostic: Dict[str, Any]
+    pos_pct: float,
+    neg_pct: float,
+    correlations: List[Dict[str, Any]],
 ) -> List[Dict[str, Any]]:
     """Generate strategic recommendations based on analytics findings."""
-    pos_pct = descriptive.get("positive_percentage", 0)
-    neg_pct = descriptive.get("negative_percentage", 0)
-    correlations = diagnostic.get("correlation_insights", [])
-    
     recommendations = []
     
     # Recommendation 1: Based on sentiment
@@ -867,8 +1077,8 @@ def _format_correlations(correlation_insights: List[Dict[str, Any]]) -> List[Dic
     """Format correlation data for frontend consumption."""
     formatted = []
     for insight in correlation_insights:
-        pair = insight.get("pair", "Unknown vs Unknown")
-        corr_value = insight.get("correlation", 0)
+        pair = insight["pair"]
+        corr_value = insight["correlation"]
         
         formatted.append({
             "factor": pair,
@@ -889,19 +1099,33 @@ def _format_correlations(correlation_insights: List[Dict[str, Any]]) -> List[Dic
 
 def run_full_analysis(df: pd.DataFrame, model) -> Dict[str, Any]:
     """Execute full analytical pipeline and format for frontend consumption."""
+    # Locate the text column and score texts once; every stage reads from the same results
+    text_column = _find_text_column(df)
+    scores = _score_texts(df, model, text_column)
+
     # Run all analytics modules
-    eda = perform_eda(df, model)
-    descriptive = descriptive_analytics(df, model)
-    diagnostic = diagnostic_analytics(df, model)
-    predictive = predictive_analytics(df, model)
-    
-    # Generate narratives
-    descriptive_narrative = _generate_narrative("descriptive", {**eda, **descriptive})
-    diagnostic_narrative = _generate_narrative("diagnostic", diagnostic)
-    predictive_narrative = _generate_narrative("predictive", predictive)
-    prescriptive_text = prescriptive_analytics({"descriptive_analytics": descriptive})
-    prescriptive_narrative = _generate_narrative("prescriptive", descriptive)
+    eda = perform_eda(df, model, scores=scores, text_column=text_column)
+    descriptive = descriptive_analytics(
+        df,
+        model,
+        scores=scores,
+        text_column=text_column,
+        sentiment_distribution=eda["sentiment_distribution"],
+    )
+    diagnostic = diagnostic_analytics(df, model, scores=scores, text_column=text_column)
+    predictive = predictive_analytics(df, model, scores=scores, text_column=text_column)
     
+    # Hoist the values the report reads repeatedly
+    total_records = eda["total_records"]
+    word_frequency = eda["word_frequency"]
+    pos_pct = descriptive["positive_percentage"]
+    neg_pct = descriptive["negative_percentage"]
+    correlation_insights = diagnostic["correlation_insights"]
+    trained = predictive["status"] == "trained"
+    accuracy = predictive["accuracy"] if trained else 0.0
+    f1 = predictive["f1_score"] if trained else 0.0
+    confidence = accuracy if trained else 0.65
+
     # Create structured output matching frontend expectations
     executive_charts = _create_executive_charts(df)
     return {
@@ -909,32 +1133,34 @@ def run_full_analysis(df: pd.DataFrame, model) -> Dict[str, Any]:
             "kpis": _create_executive_kpis(df),
             **executive_charts,
         },
-        "biOverview": _create_bi_overview(df, eda, descriptive),
+        "biOverview": _create_bi_overview(
+            df, eda["sentiment_distribution"], word_frequency, total_records
+        ),
         "descriptive": {
-            "kpis": _create_kpis(df, eda, descriptive),
-            "narrative": descriptive_narrative,
-            "chartData": eda.get("word_frequency", [])
+            "kpis": _create_kpis(df, total_records, eda["average_text_length"], pos_pct, neg_pct),
+            "narrative": _descriptive_narrative(total_records, pos_pct, neg_pct),
+            "chartData": word_frequency
         },
         "diagnostic": {
-            "narrative": diagnostic_narrative,
-            "correlations": _format_correlations(diagnostic.get("correlation_insights", []))
+            "narrative": _diagnostic_narrative(diagnostic["negative_keywords"], correlation_insights),
+            "correlations": _format_correlations(correlation_insights)
         },
         "predictive": {
-            "narrative": predictive_narrative,
-            "forecast": _create_forecast(df, predictive, eda.get("total_records", 100)),
-            "confidence": predictive.get("accuracy", 0.75) if predictive.get("status") == "trained" else 0.65,
+            "narrative": _predictive_narrative(trained, accuracy, f1),
+            "forecast": _create_forecast(df, confidence, total_records),
+            "confidence": confidence,
             "modelExplanation": (
-                f"Logistic Regression classifier trained on {eda.get('total_records', 0)} records "
+                f"Logistic Regression classifier trained on {total_records} records "
                 f"using TF-IDF vectorization. "
-                f"Model metrics: Accuracy={predictive.get('accuracy', 0):.3f}, "
-                f"F1-Score={predictive.get('f1_score', 0):.3f}"
-                if predictive.get("status") == "trained"
+                f"Model metrics: Accuracy={accuracy:.3f}, "
+                f"F1-Score={f1:.3f}"
+                if trained
                 else "Predictive model requires minimum dataset size for training reliability."
             )
         },
         "prescriptive": {
-            "narrative": prescriptive_narrative,
-            "recommendations": _create_recommendations(descriptive, diagnostic),
+            "narrative": _prescriptive_narrative(pos_pct, neg_pct),
+            "recommendations": _create_recommendations(pos_pct, neg_pct, correlation_insights),
             "disclaimer": (
                 "Recommendations are generated through statistical analysis and should be "
                 "validated by domain experts. Results are indicative and not guaranteed. "
@@ -1,7 +1,19 @@
 import os
+import threading
+from collections import defaultdict
+from typing import Dict, List
 
+# Pin native thread pools before torch/BLAS load so Flask workers, torch and
+# sklearn do not oversubscribe the cores.
+_TORCH_THREADS = max(1, (os.cpu_count() or 2) // 2)
+os.environ.setdefault("OMP_NUM_THREADS", str(_TORCH_THREADS))
+os.environ.setdefault("MKL_NUM_THREADS", str(_TORCH_THREADS))
+
+import orjson
 import pandas as pd
-from flask import Flask, jsonify, request
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+from flask import Flask, Response, jsonify, request
 from flask_cors import CORS
 from werkzeug.exceptions import HTTPException
 
@@ -18,8 +30,65 @@ CORS(
     methods=["GET", "POST", "OPTIONS"]
 )
 
-# Lazy load sentiment model to avoid startup crashes
+# Sentiment model is loaded lazily, or warmed up in the background when run as a script
 SENTIMENT_MODEL = None
+_MODEL_LOCK = threading.Lock()
+
+
+def jsonify_fast(obj) -> Response:
+    """Serialize large reports with orjson; numpy values need no tolist() first."""
+    return Response(
+        orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS),
+        mimetype="application/json",
+    )
+
+
+def _dedupe_headers(names: List[str]) -> List[str]:
+    """Name blank and repeated headers the way the C engine does ("Unnamed: 2", "a.1")."""
+    counts: Dict[str, int] = defaultdict(int)
+    result = []
+    for i, name in enumerate(names):
+        name = name or f"Unnamed: {i}"
+        count = counts[name]
+        while count > 0:
+            counts[name] = count + 1
+            name = f"{name}.{count}"
+            count = counts[name]
+        counts[name] = count + 1
+        result.append(name)
+    return result
+
+
+def read_csv_upload(file) -> pd.DataFrame:
+    """Parse a CSV with pyarrow, keeping date/time-like columns as text.
+
+    pyarrow infers ISO dates and timestamps as temporal types where the C engine
+    keeps strings, which would change the column chosen as the text column.
+    Such columns are re-read as strings. Bytes that are not valid UTF-8 come
+    back as binary columns and are rejected like the C engine's decode error.
+    """
+    df = pd.read_csv(file, engine="pyarrow", dtype_backend="pyarrow")
+    if any(
+        pa.types.is_binary(dtype.pyarrow_dtype) or pa.types.is_large_binary(dtype.pyarrow_dtype)
+        for dtype in df.dtypes
+    ):
+        raise ValueError("CSV file is not valid UTF-8.")
+    temporal = [
+        column for column, dtype in df.dtypes.items()
+        if pa.types.is_temporal(dtype.pyarrow_dtype)
+    ]
+    if temporal:
+        # pandas casts after parsing, so the raw text must be requested from pyarrow
+        file.seek(0)
+        table = pa_csv.read_csv(
+            file,
+            convert_options=pa_csv.ConvertOptions(
+                column_types={column: pa.string() for column in temporal}
+            ),
+        )
+        df = table.to_pandas(types_mapper=pd.ArrowDtype)
+    df.columns = _dedupe_headers([str(column) for column in df.columns])
+    return df
 
 
 @app.errorhandler(HTTPException)
@@ -39,14 +108,29 @@ def get_model():
     """Lazy load the sentiment model."""
     global SENTIMENT_MODEL
     if SENTIMENT_MODEL is None:
-        try:
-            SENTIMENT_MODEL = get_sentiment_model()
-        except Exception as e:
-            app.logger.error(f"Failed to load sentiment model: {e}")
-            raise
+        with _MODEL_LOCK:
+            if SENTIMENT_MODEL is None:
+                try:
+                    SENTIMENT_MODEL = get_sentiment_model()
+                except Exception as e:
+                    app.logger.error(f"Failed to load sentiment model: {e}")
+                    raise
     return SENTIMENT_MODEL
 
 
+def _warm_up_model():
+    """Load the model off the request path; failures are retried on first request."""
+    try:
+        get_model()
+    except Exception:
+        app.logger.exception("Sentiment model warm-up failed; retrying on first request.")
+
+
+def start_model_warm_up() -> None:
+    """Load the model in a background thread so startup never blocks or crashes on it."""
+    threading.Thread(target=_warm_up_model, daemon=True).start()
+
+
 @app.route("/analyze-text", methods=["POST"])
 def analyze_text():
     payload = request.get_json(silent=True)
@@ -82,7 +166,7 @@ def analyze_dataset():
         return jsonify({"error": "Empty filename for uploaded file."}), 400
 
     try:
-        df = pd.read_csv(file_storage)
+        df = read_csv_upload(file_storage)
     except Exception:
         app.logger.exception("Failed to parse CSV.")
         return jsonify({"error": "Failed to parse CSV file."}), 400
@@ -91,7 +175,7 @@ def analyze_dataset():
         df = clean_dataframe(df)
         model = get_model()
         report = run_full_analysis(df, model)
-        return jsonify(report)
+        return jsonify_fast(report)
     except Exception as e:
         app.logger.exception("Dataset analytics failed.")
         import traceback
@@ -120,7 +204,7 @@ def analyze_json_dataset():
         df = clean_dataframe(df)
         model = get_model()
         report = run_full_analysis(df, model)
-        return jsonify(report)
+        return jsonify_fast(report)
     except Exception as e:
         app.logger.exception("JSON dataset analytics failed.")
         import traceback
@@ -132,4 +216,5 @@ def analyze_json_dataset():
 if __name__ == "__main__":
     host = os.getenv("HOST", "127.0.0.1")
     port = int(os.getenv("PORT", "5000"))
+    start_model_warm_up()
     app.run(host=host, port=port, debug=False)
@@ -1,14 +1,87 @@
+import logging
 import os
+import re
 from functools import lru_cache
 
-from transformers import pipeline
+import torch
+from transformers import AutoTokenizer, pipeline
+
+try:
+    from optimum.onnxruntime import ORTModelForSequenceClassification, ORTQuantizer
+    from optimum.onnxruntime.configuration import AutoQuantizationConfig
+except ImportError:  # optimum[onnxruntime] is optional; fall back to PyTorch
+    ORTModelForSequenceClassification = None
 
 MODEL_NAME = os.getenv(
     "SENTIMENT_MODEL",
     "distilbert-base-uncased-finetuned-sst-2-english",
 )
+QUANTIZE = os.getenv("SENTIMENT_QUANTIZE", "1") != "0"
+ONNX_DIR = os.getenv(
+    "SENTIMENT_ONNX_DIR",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "onnx_model"),
+)
+QUANTIZED_FILE = "model_quantized.onnx"
+COMPILE = os.getenv("SENTIMENT_COMPILE", "1") != "0"
+
+logger = logging.getLogger(__name__)
+
+
+def _load_quantized_model():
+    """Export the model to ONNX once, quantize it to int8 and wrap it in a pipeline."""
+    # One export per model so changing SENTIMENT_MODEL does not reuse a stale file
+    model_dir = os.path.join(ONNX_DIR, re.sub(r"[^\w.-]+", "_", MODEL_NAME))
+    if not os.path.exists(os.path.join(model_dir, QUANTIZED_FILE)):
+        ort_model = ORTModelForSequenceClassification.from_pretrained(MODEL_NAME, export=True)
+        quantizer = ORTQuantizer.from_pretrained(ort_model)
+        quantizer.quantize(
+            save_dir=model_dir,
+            quantization_config=AutoQuantizationConfig.avx512_vnni(is_static=False, per_channel=False),
+        )
+    model = ORTModelForSequenceClassification.from_pretrained(model_dir, file_name=QUANTIZED_FILE)
+    return pipeline(
+        "sentiment-analysis",
+        model=model,
+        tokenizer=AutoTokenizer.from_pretrained(MODEL_NAME),
+        truncation=True,
+        max_length=256,
+    )
+
+
+def _compile_model(pipe, use_gpu: bool):
+    """Fuse the forward pass with torch.compile, keeping the eager model on failure.
+
+    The compiled module is not thread-safe; callers score through one batched call.
+    """
+    eager_model = pipe.model
+    # "reduce-overhead" captures CUDA graphs, which only apply on the GPU
+    mode = "reduce-overhead" if use_gpu else "default"
+    try:
+        pipe.model = torch.compile(eager_model, mode=mode, dynamic=True)
+        # Compilation is lazy; trigger it now so failures surface here, not mid-request
+        pipe(["warm up"], batch_size=1)
+    except Exception:
+        logger.exception("torch.compile unavailable; using eager PyTorch model.")
+        pipe.model = eager_model
+    return pipe
 
 
 @lru_cache(maxsize=1)
 def get_sentiment_model():
-    return pipeline("sentiment-analysis", model=MODEL_NAME)
+    """Load the sentiment pipeline once per process; every caller shares the instance."""
+    torch.set_num_threads(max(1, (os.cpu_count() or 2) // 2))
+    use_gpu = torch.cuda.is_available()
+    if QUANTIZE and not use_gpu and ORTModelForSequenceClassification is not None:
+        try:
+            return _load_quantized_model()
+        except Exception:
+            logger.exception("Quantized ONNX model unavailable; using PyTorch pipeline.")
+
+    pipe = pipeline(
+        "sentiment-analysis",
+        model=MODEL_NAME,
+        truncation=True,
+        max_length=256,
+        device=0 if use_gpu else -1,
+    )
+    return _compile_model(pipe, use_gpu) if COMPILE else pipe
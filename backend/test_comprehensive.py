@@ -1,13 +1,13 @@
 #!/usr/bin/env python
 """Comprehensive API test suite."""
-import requests
+from _client import session
 
 print("=== COMPREHENSIVE API TESTS ===\n")
 
 # Test 1: Empty/minimal data validation
 print("Test 1: Minimal data validation")
 try:
-    r = requests.post('http://127.0.0.1:5000/analyze', 
+    r = session.post('http://127.0.0.1:5000/analyze',
                      json={'data': []}, timeout=10)
     if r.status_code == 400:
         print("✓ Empty data properly rejected")
@@ -19,7 +19,7 @@ except Exception as e:
 # Test 2: Text analysis endpoint
 print("\nTest 2: Text analysis endpoint")
 try:
-    r = requests.post('http://127.0.0.1:5000/analyze-text',
+    r = session.post('http://127.0.0.1:5000/analyze-text',
                      json={'text': 'This is amazing!'}, timeout=10)
     if r.status_code == 200:
         result = r.json()
@@ -48,7 +48,7 @@ data = {
 }
 
 try:
-    r = requests.post('http://127.0.0.1:5000/analyze', json=data, timeout=30)
+    r = session.post('http://127.0.0.1:5000/analyze', json=data, timeout=30)
     if r.status_code == 200:
         result = r.json()
         required_keys = ['biOverview', 'descriptive', 'diagnostic', 'predictive', 'prescriptive']
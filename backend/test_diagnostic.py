@@ -4,10 +4,21 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(__file__))
 
-import pandas as pd
-from analytics_engine import run_full_analysis
-from model_loader import get_sentiment_model
-from utils import clean_dataframe
+
+def load_pipeline():
+    """Import the analysis stack and load the model on first use.
+
+    Heavy imports (pandas, torch via model_loader) stay out of module scope so
+    the HTTP-only TEST 3 does not pay for them. get_sentiment_model is memoized,
+    so TEST 2 reuses the model TEST 1 loaded.
+    """
+    import pandas as pd
+    from analytics_engine import run_full_analysis
+    from model_loader import get_sentiment_model
+    from utils import clean_dataframe
+
+    return pd, clean_dataframe, run_full_analysis, get_sentiment_model()
+
 
 # Test 1: Direct function call with mixed sentiment
 print("=" * 60)
@@ -21,9 +32,9 @@ data1 = [
 ]
 
 try:
-    df1 = pd.DataFrame(data1)
+    pd, clean_dataframe, run_full_analysis, model = load_pipeline()
+    df1 = pd.DataFrame(data1).astype({'value': 'int32'})
     df1 = clean_dataframe(df1)
-    model = get_sentiment_model()
     result1 = run_full_analysis(df1, model)
     print("✓ Success - Mixed sentiment works")
 except Exception as e:
@@ -34,12 +45,13 @@ print("\n" + "=" * 60)
 print("TEST 2: Direct analytics with single sentiment (15 records)")
 print("=" * 60)
 
-data2 = [{'comment': f'Good #{i}!', 'value': 100-i} for i in range(15)]
+n = 15
+data2 = {'comment': [f'Good #{i}!' for i in range(n)], 'value': [100 - i for i in range(n)]}
 
 try:
+    pd, clean_dataframe, run_full_analysis, model = load_pipeline()
     df2 = pd.DataFrame(data2)
     df2 = clean_dataframe(df2)
-    model = get_sentiment_model()
     result2 = run_full_analysis(df2, model)
     print("✓ Success - Single sentiment handled gracefully")
     print(f"  Predicted status: {result2.get('predictive', {}).get('narrative', '')[:100]}")
@@ -53,12 +65,15 @@ print("\n" + "=" * 60)
 print("TEST 3: Flask endpoint via HTTP")
 print("=" * 60)
 
-import requests
 import time
+
+from _client import session
 time.sleep(2)
 
+records2 = [dict(zip(data2, row)) for row in zip(*data2.values())]
+
 try:
-    r = requests.post('http://127.0.0.1:5000/analyze', json={'data': data2}, timeout=30)
+    r = session.post('http://127.0.0.1:5000/analyze', json={'data': records2}, timeout=30)
     print(f"HTTP Status: {r.status_code}")
     if r.status_code == 200:
         print("✓ Flask endpoint returned 200 OK")
@@ -4,7 +4,8 @@ from model_loader import get_sentiment_model
 from utils import clean_dataframe
 
 # Create test data with all positive sentiment
-data = [{'comment': f'Good #{i}!', 'value': 100-i} for i in range(15)]
+n = 15
+data = {'comment': [f'Good #{i}!' for i in range(n)], 'value': [100 - i for i in range(n)]}
 df = pd.DataFrame(data)
 df = clean_dataframe(df)
 
@@ -1,42 +1,42 @@
-"""Test the /analyze endpoint"""
-import json
+"""Test the /analyze endpoint against a running backend.
+
+Run with `pytest test_endpoint.py`; all payloads share one process and one
+pooled HTTP session.
+"""
+import pytest
 import requests
 
+from _client import post_json, read_json, session
+
 API_URL = "http://127.0.0.1:5000/analyze"
 
-# Simple test data
-test_data = [
-    {"text": "This is great!", "rating": 5},
-    {"text": "Not good", "rating": 2},
-    {"text": "Amazing product", "rating": 5},
+PAYLOADS = [
+    [
+        {"text": "This is great!", "rating": 5},
+        {"text": "Not good", "rating": 2},
+        {"text": "Amazing product", "rating": 5},
+    ],
+    [
+        {"text": "Great product!", "rating": 5},
+        {"text": "Not good", "rating": 2},
+        {"text": "Amazing!", "rating": 5},
+    ],
 ]
 
-print("Testing /analyze endpoint...")
-print(f"URL: {API_URL}")
-print(f"Payload: {json.dumps({'data': test_data}, indent=2)}")
-
-try:
-    response = requests.post(
-        API_URL,
-        json={"data": test_data},
-        headers={"Content-Type": "application/json"},
-        timeout=30
-    )
-    
-    print(f"\nStatus Code: {response.status_code}")
-    
-    if response.status_code == 200:
-        print("✅ SUCCESS! API is responding correctly")
-        result = response.json()
-        print(f"\n✅ Response structure includes:")
-        for key in result.keys():
-            print(f"  - {key}")
-    else:
-        print(f"❌ ERROR: {response.status_code}")
-        print(f"Response: {response.text}")
-        
-except requests.exceptions.ConnectionError:
-    print("❌ CONNECTION ERROR: Cannot connect to backend at http://127.0.0.1:5000")
-    print("Make sure the Flask server is running!")
-except Exception as e:
-    print(f"❌ ERROR: {str(e)}")
+
+@pytest.fixture(scope="session")
+def client():
+    try:
+        session.head(API_URL, timeout=5)
+    except requests.exceptions.RequestException:
+        pytest.skip("Cannot connect to backend at http://127.0.0.1:5000; is the Flask server running?")
+    yield session
+
+
+@pytest.mark.parametrize("data", PAYLOADS)
+def test_analyze(client, data):
+    response = post_json(API_URL, {"data": data}, session=client, stream=True, timeout=60)
+    assert response.status_code == 200, response.text[:500]
+    result = read_json(response)
+    for key in ["biOverview", "descriptive", "diagnostic", "predictive", "prescriptive"]:
+        assert key in result
@@ -1,27 +1,133 @@
 import re
-from typing import Any
+from functools import lru_cache
+from typing import List
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 
+try:  # google-re2 scans linearly with no backtracking; optional
+    import re2
+except ImportError:
+    re2 = None
 
+try:  # numba compiles the object-column whitespace kernel; optional
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+# Copy-on-Write is always on from pandas 3 (where the option is deprecated); on
+# 2.x opt in so dropna/drop_duplicates and column writes copy only when needed
+if int(pd.__version__.split(".", 1)[0]) < 3:
+    pd.set_option("mode.copy_on_write", True)
+
+# Anything that is not a letter or digit (unicode-aware) separates tokens
+_CLEAN_RE = re.compile(r"[\W_]+")
+# Every character Python's \s matches, spelled out: Arrow's and RE2's \s are
+# ASCII-only. One pass also covers \r, \n and \t.
+_WS_PATTERN = "[\t-\r\x1c-\x1f \x85\xa0\u1680\u2000-\u200a\u2028\u2029\u202f\u205f\u3000]+"
+_WS_RE = (re2 or re).compile(_WS_PATTERN)
+# Below this many distinct strings the one-off JIT compile costs more than the regex pass
+_NUMBA_MIN_STRINGS = 10_000
+
+
+@lru_cache(maxsize=1 << 16)
 def clean_text(text: str) -> str:
-    text = text.replace("\x00", " ")
-    text = re.sub(r"[\r\n\t]+", " ", text)
-    text = re.sub(r"\s+", " ", text)
-    return text.strip()
+    # Every whitespace character except " " is non-printable, so printable text
+    # without double spaces only needs its ends trimmed
+    if text.isprintable() and "  " not in text:
+        return text.strip()
+    return _WS_RE.sub(" ", text.replace("\x00", " ")).strip()
+
+
+def clean_series(series: pd.Series) -> pd.Series:
+    """Vectorized tokenizer prep: lowercase and replace non-alphanumerics with spaces."""
+    return series.fillna("").astype(str).str.replace(_CLEAN_RE, " ", regex=True).str.lower()
+
+
+if njit is not None:
+
+    @njit(parallel=True)
+    def _collapse_whitespace(buffer, offsets, out, out_lengths):
+        """clean_text over ASCII rows packed into one byte buffer, one row per thread."""
+        for row in prange(len(offsets) - 1):
+            start = offsets[row]
+            write = start
+            pending = False
+            for i in range(start, offsets[row + 1]):
+                byte = buffer[i]
+                # \x00 plus every ASCII character Python's \s matches
+                if byte == 0 or byte == 32 or 9 <= byte <= 13 or 28 <= byte <= 31:
+                    pending = write > start
+                else:
+                    if pending:
+                        out[write] = 32
+                        write += 1
+                        pending = False
+                    out[write] = byte
+                    write += 1
+            out_lengths[row] = write - start
+
+
+def _clean_with_kernel(strings: List[str]) -> List[str]:
+    """clean_text over many strings; ASCII ones go through the numba kernel in one call."""
+    positions = [index for index, text in enumerate(strings) if text.isascii()]
+    cleaned = [text if text.isascii() else clean_text(text) for text in strings]
+    encoded = [strings[index].encode("ascii") for index in positions]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum(np.fromiter(map(len, encoded), dtype=np.int64, count=len(encoded)), out=offsets[1:])
+    buffer = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+    out = np.empty_like(buffer)
+    out_lengths = np.empty(len(encoded), dtype=np.int64)
+    _collapse_whitespace(buffer, offsets, out, out_lengths)
+    raw = out.tobytes()
+    for index, start, length in zip(positions, offsets[:-1].tolist(), out_lengths.tolist()):
+        cleaned[index] = raw[start:start + length].decode("ascii")
+    return cleaned
+
+
+def _clean_object_column(series: pd.Series) -> pd.Series:
+    """Clean each distinct string once and map the results back; other cells are untouched."""
+    uniques = [value for value in pd.unique(series) if isinstance(value, str)]
+    if not uniques:
+        return series
+    if njit is not None and len(uniques) >= _NUMBA_MIN_STRINGS:
+        cleaned = _clean_with_kernel(uniques)
+    else:
+        cleaned = [clean_text(text) for text in uniques]
+    result = series.map(dict(zip(uniques, cleaned)))
+    return result.where(result.notna(), series)
 
 
-def _normalize_value(value: Any) -> Any:
-    if isinstance(value, str):
-        return clean_text(value)
-    return value
+def _clean_string_series(series: pd.Series) -> pd.Series:
+    """Vectorized clean_text over a column; non-string cells are left untouched."""
+    if series.dtype == object:
+        return _clean_object_column(series)
+    if isinstance(series.dtype, pd.ArrowDtype):
+        arrow_type = series.dtype.pyarrow_dtype
+        # select_dtypes("string") also matches e.g. null[pyarrow] (an all-null column)
+        if not (pa.types.is_string(arrow_type) or pa.types.is_large_string(arrow_type)):
+            return series
+    # Clean each distinct value once, then expand back by code; keeps the column dtype
+    codes, uniques = pd.factorize(series)
+    cleaned = (
+        pd.Series(uniques)
+        .str.replace("\x00", " ", regex=False)
+        .str.replace(_WS_PATTERN, " ", regex=True)
+        .str.strip()
+    )
+    return pd.Series(cleaned.array.take(codes, allow_fill=True), index=series.index, name=series.name)
 
 
 def clean_dataframe(df: pd.DataFrame) -> pd.DataFrame:
     """Basic cleaning: drop nulls, dedupe, normalize string whitespace."""
-    cleaned = df.copy()
-    cleaned = cleaned.dropna(how="all")
-    cleaned = cleaned.drop_duplicates()
-    for column in cleaned.columns:
-        cleaned[column] = cleaned[column].apply(_normalize_value)
+    # dropna/drop_duplicates already return new frames; no up-front copy needed
+    cleaned = df.dropna(how="all").drop_duplicates()
+    # Arrow-backed columns keep strings in contiguous buffers, so the .str calls
+    # below run as Arrow compute kernels instead of per-object Python calls
+    cleaned = cleaned.convert_dtypes(dtype_backend="pyarrow")
+    # One bulk assignment per dtype group instead of one setitem per column
+    string_columns = cleaned.select_dtypes(include=["object", "string"]).columns
+    if len(string_columns):
+        cleaned[string_columns] = cleaned[string_columns].apply(_clean_string_series)
     return cleaned